@@ -30,6 +30,27 @@ from openai import BadRequestError
 
 logger = logging.getLogger(__name__)
 
+# OSC (Operating System Command): ESC `]` payload, terminated by BEL or
+# ST (ESC \).  Catches hyperlink escapes, iTerm2 inline images,
+# terminal-title sets, etc.
+_OSC_RE = re.compile(r'\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)')
+# Full CSI matcher per ECMA-48: ESC `[`, then parameter-bytes (0x30-0x3f,
+# includes 0-9 and `:;<=>?`), intermediate-bytes (0x20-0x2f), final-byte
+# (0x40-0x7e).  Covers SGR (m), cursor moves (A-D/G/H/F), erase (J/K),
+# private-mode (h/l), 24-bit color forms using `:`, and everything else
+# a terminal emits.
+_CSI_RE = re.compile(r'\x1b\[[\x30-\x3f]*[\x20-\x2f]*[\x40-\x7e]')
+# Deletion table for str.translate: everything in 0x00-0x1F except
+# \t \n \r (valid JSON whitespace), plus the lone DEL (0x7F).
+# translate runs the whole pass in C, one table lookup per char.
+_CTRL_TABLE = dict.fromkeys(
+    c for c in range(0x20) if c not in (0x09, 0x0a, 0x0d)
+)
+_CTRL_TABLE[0x7f] = None
+# Lone backslashes that don't start a valid JSON escape
+# (\" \\ \/ \b \f \n \r \t \uXXXX) get doubled on the retry path.
+_BAD_ESCAPE_RE = re.compile(r'\\(?!["\\/bfnrtu])')
+
 
 class BadRequestRetryMiddleware(AgentMiddleware):
     """Catch BadRequestError from the model API, sanitize messages, and retry.
@@ -61,10 +82,8 @@ class BadRequestRetryMiddleware(AgentMiddleware):
 
         Keeps \\n (0x0A), \\r (0x0D), \\t (0x09) — valid JSON whitespace.
 
-        Also strips ANSI escape sequences (full ECMA-48 CSI matcher:
-        `\\x1b\\[` + parameter bytes (0x30-0x3f) + intermediate bytes
-        (0x20-0x2f) + final byte 0x40-0x7e — see the regex below for
-        the verbatim pattern) that show up in `execute` tool output
+        Also strips ANSI escape sequences (full ECMA-48 CSI matcher —
+        see ``_CSI_RE``) that show up in `execute` tool output
         from colorized terminal commands.  Some llama.cpp / OpenAI-compat endpoints reject
         these as malformed UTF-8 in the JSON body — sanitize before
         retry so the retry has a chance of succeeding.  (Previously
@@ -72,23 +91,17 @@ class BadRequestRetryMiddleware(AgentMiddleware):
         after_tool hook; that middleware was deleted on 2026-05-16 as
         part of the context-management overhaul.  See
         docs/2026-05-16-context-management-overhaul.org.)
+
+        Defense in depth: OutputSanitizationMiddleware already strips
+        ANSI from ToolMessages proactively (before they enter state);
+        this layer catches anything that slipped through (e.g., ANSI
+        embedded in AIMessage content) on the retry path.
         """
-        # OSC (Operating System Command): ESC `]` payload, terminated by
-        # BEL or ST (ESC \).  Catches hyperlink escapes, iTerm2 inline
-        # images, terminal-title sets, etc.  Must run BEFORE the CSI
-        # strip so the OSC payload doesn't get partially eaten.
-        text = re.sub(r'\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)', '', text)
-        # Full CSI matcher per ECMA-48: ESC `[`, then parameter-bytes
-        # (0x30-0x3f, includes 0-9 and `:;<=>?`), intermediate-bytes
-        # (0x20-0x2f), final-byte (0x40-0x7e).  Covers SGR (m), cursor
-        # moves (A-D/G/H/F), erase (J/K), private-mode (h/l), 24-bit
-        # color forms using `:`, and everything else a terminal emits.
-        # Defense in depth: OutputSanitizationMiddleware already strips
-        # ANSI from ToolMessages proactively (before they enter state);
-        # this layer catches anything that slipped through (e.g., ANSI
-        # embedded in AIMessage content) on the retry path.
-        text = re.sub(r'\x1b\[[\x30-\x3f]*[\x20-\x2f]*[\x40-\x7e]', '', text)
-        return re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+        # OSC must run BEFORE the CSI strip so the OSC payload doesn't
+        # get partially eaten.
+        text = _OSC_RE.sub('', text)
+        text = _CSI_RE.sub('', text)
+        return text.translate(_CTRL_TABLE)
 
     @staticmethod
     def _fix_json_escapes(text: str) -> str:
@@ -96,7 +109,7 @@ class BadRequestRetryMiddleware(AgentMiddleware):
 
         Valid JSON escapes: \" \\ \/ \b \f \n \r \t \uXXXX
         """
-        return re.sub(r'\\(?!["\\/bfnrtu])', r'\\\\', text)
+        return _BAD_ESCAPE_RE.sub(r'\\\\', text)
 
     def _sanitize_text(self, text: str) -> str:
         """Apply all text-level sanitization passes."""
@@ -128,51 +141,75 @@ class BadRequestRetryMiddleware(AgentMiddleware):
             return text[:max_chars] + "\n\n[Content truncated due to size]"
         return content
 
+    @staticmethod
+    def _copy_message(msg):
+        """Shallow-copy a message, falling back to in-place for exotic types."""
+        if hasattr(msg, 'model_copy'):
+            return msg.model_copy()
+        if hasattr(msg, 'copy'):
+            return msg.copy()
+        # Can't copy — sanitize in place (risky but last resort)
+        return msg
+
     def _sanitize_messages(self, messages, aggressive: bool = False):
         """Return a sanitized copy of the message list.
 
+        Messages that sanitization leaves untouched are reused by
+        identity — only messages whose content, tool calls, or raw
+        additional_kwargs actually changed get shallow-copied.  On a
+        long history the dirty messages are usually a handful, so this
+        avoids a per-retry copy of the entire list.
+
         Args:
             messages: List of LangChain message objects.
             aggressive: If True, also truncate large tool results.
         """
         sanitized = []
         for msg in messages:
-            # Create a shallow copy
-            if hasattr(msg, 'model_copy'):
-                new_msg = msg.model_copy()
-            elif hasattr(msg, 'copy'):
-                new_msg = msg.copy()
-            else:
-                new_msg = msg
-                # Can't copy — just sanitize in place (risky but last resort)
+            new_msg = msg
 
             # Sanitize content
-            if hasattr(new_msg, 'content') and new_msg.content is not None:
-                new_msg.content = self._sanitize_message_content(new_msg.content)
+            if hasattr(msg, 'content') and msg.content is not None:
+                new_content = self._sanitize_message_content(msg.content)
                 if aggressive:
-                    new_msg.content = self._truncate_large_content(new_msg.content)
+                    new_content = self._truncate_large_content(new_content)
+                if new_content != msg.content:
+                    new_msg = self._copy_message(msg)
+                    new_msg.content = new_content
 
             # Sanitize tool call arguments
-            if hasattr(new_msg, 'tool_calls') and new_msg.tool_calls:
+            if hasattr(msg, 'tool_calls') and msg.tool_calls:
                 sanitized_calls = []
-                for tc in new_msg.tool_calls:
-                    new_tc = dict(tc)
-                    if 'args' in new_tc and isinstance(new_tc['args'], dict):
+                calls_changed = False
+                for tc in msg.tool_calls:
+                    new_tc = tc
+                    if 'args' in tc and isinstance(tc['args'], dict):
                         new_args = {}
-                        for k, v in new_tc['args'].items():
+                        args_changed = False
+                        for k, v in tc['args'].items():
                             if isinstance(v, str):
-                                new_args[k] = self._sanitize_text(v)
+                                new_v = self._sanitize_text(v)
+                                if new_v != v:
+                                    args_changed = True
+                                new_args[k] = new_v
                             else:
                                 new_args[k] = v
-                        new_tc['args'] = new_args
+                        if args_changed:
+                            new_tc = dict(tc)
+                            new_tc['args'] = new_args
+                            calls_changed = True
                     sanitized_calls.append(new_tc)
-                new_msg.tool_calls = sanitized_calls
+                if calls_changed:
+                    if new_msg is msg:
+                        new_msg = self._copy_message(msg)
+                    new_msg.tool_calls = sanitized_calls
 
             # Sanitize additional_kwargs tool calls (raw OpenAI format)
-            if hasattr(new_msg, 'additional_kwargs'):
-                ak_calls = new_msg.additional_kwargs.get('tool_calls', [])
+            if hasattr(msg, 'additional_kwargs'):
+                ak_calls = msg.additional_kwargs.get('tool_calls', [])
                 if ak_calls:
                     fixed_calls = []
+                    ak_changed = False
                     for tc in ak_calls:
                         func = tc.get('function', {})
                         args_str = func.get('arguments')
@@ -182,13 +219,37 @@ class BadRequestRetryMiddleware(AgentMiddleware):
                                 tc = dict(tc)
                                 tc['function'] = dict(func)
                                 tc['function']['arguments'] = fixed_str
+                                ak_changed = True
                         fixed_calls.append(tc)
-                    new_msg.additional_kwargs = dict(new_msg.additional_kwargs)
-                    new_msg.additional_kwargs['tool_calls'] = fixed_calls
+                    if ak_changed:
+                        if new_msg is msg:
+                            new_msg = self._copy_message(msg)
+                        new_msg.additional_kwargs = dict(msg.additional_kwargs)
+                        new_msg.additional_kwargs['tool_calls'] = fixed_calls
 
             sanitized.append(new_msg)
         return sanitized
 
+    def _truncate_messages(self, messages):
+        """Truncate oversized content only, reusing unchanged messages.
+
+        The aggressive step-up on later retries goes through this instead
+        of a second `_sanitize_messages` pass: the text passes already ran,
+        and `_fix_json_escapes` is not idempotent (it re-matches the second
+        backslash of an escape it just produced, compounding backslashes on
+        every re-application) — so only the truncation delta may apply.
+        """
+        truncated = []
+        for msg in messages:
+            new_msg = msg
+            if hasattr(msg, 'content') and msg.content is not None:
+                new_content = self._truncate_large_content(msg.content)
+                if new_content is not msg.content:
+                    new_msg = self._copy_message(msg)
+                    new_msg.content = new_content
+            truncated.append(new_msg)
+        return truncated
+
     # ------------------------------------------------------------------
     # Middleware hook
     # ------------------------------------------------------------------
@@ -197,6 +258,7 @@ class BadRequestRetryMiddleware(AgentMiddleware):
         """Intercept model calls and retry on BadRequestError with sanitization."""
         last_error = None
         num_messages = len(request.messages)
+        last_sanitize_aggressive = None
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -234,10 +296,22 @@ class BadRequestRetryMiddleware(AgentMiddleware):
                     str(exc)[:200],
                 )
 
-                sanitized_messages = self._sanitize_messages(
-                    request.messages, aggressive=aggressive
-                )
-                request = request.override(messages=sanitized_messages)
+                # The text passes run at most ONCE per call: the escape
+                # fixer is not idempotent (re-applying it compounds
+                # backslashes, \x -> \\x -> \\\x), so the aggressive
+                # step-up applies only the truncation delta, and repeat
+                # attempts at the same level skip sanitization entirely
+                # and ride on provider non-determinism.
+                if last_sanitize_aggressive is None:
+                    request = request.override(
+                        messages=self._sanitize_messages(request.messages)
+                    )
+                    last_sanitize_aggressive = False
+                if aggressive and not last_sanitize_aggressive:
+                    request = request.override(
+                        messages=self._truncate_messages(request.messages)
+                    )
+                    last_sanitize_aggressive = True
 
         # Should not reach here
         raise last_error  # type: ignore[misc]
@@ -10,6 +10,14 @@ from langgraph.runtime import Runtime
 
 logger = logging.getLogger(__name__)
 
+# Control characters that break vLLM's JSON parsing: everything in
+# 0x00-0x1F except \t \n \r (valid JSON whitespace), plus lone DEL.
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+# Fast-path gate for _sanitize_string_content: a string with none of
+# these characters cannot need any sanitization, so one C-level scan
+# decides whether to do any per-string work (most content is clean).
+_NEEDS_SANITIZE_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\\]')
+
 
 class JsonValidationMiddleware(AgentMiddleware):
     """Middleware that validates and sanitizes JSON in tool call arguments.
@@ -91,7 +99,7 @@ class JsonValidationMiddleware(AgentMiddleware):
         """
         # Keep \n (0x0A), \r (0x0D), \t (0x09) — they are valid JSON whitespace.
         # Remove everything else in 0x00–0x1F range plus the lone DEL (0x7F).
-        return re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+        return _CONTROL_CHARS_RE.sub('', text)
 
     def _sanitize_string_content(self, text: str) -> str:
         """Sanitize string content to ensure it's JSON-safe.
@@ -111,6 +119,12 @@ class JsonValidationMiddleware(AgentMiddleware):
         if not isinstance(text, str):
             return text
 
+        # Fast path: no control chars and no backslashes means nothing below
+        # can change the string.  One C-level scan, zero allocation — this is
+        # the common case for clean message content of any size.
+        if not _NEEDS_SANITIZE_RE.search(text):
+            return text
+
         # First pass: strip control characters that vLLM can't handle even
         # when properly JSON-encoded (null bytes cause "Expecting ':' delimiter").
         text = self._strip_control_chars(text)
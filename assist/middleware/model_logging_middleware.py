@@ -93,23 +93,26 @@ class ModelLoggingMiddleware(AgentMiddleware):
     def _format_message(self, msg: Any) -> str:
         """Format a message for logging."""
         if isinstance(msg, SystemMessage):
-            return f"[SYSTEM] {msg.content[:200]}..." if len(msg.content) > 200 else f"[SYSTEM] {msg.content}"
+            content = msg.content
+            return f"[SYSTEM] {content[:200]}..." if len(content) > 200 else f"[SYSTEM] {content}"
         elif isinstance(msg, HumanMessage):
-            return f"[USER] {msg.content[:200]}..." if len(msg.content) > 200 else f"[USER] {msg.content}"
+            content = msg.content
+            return f"[USER] {content[:200]}..." if len(content) > 200 else f"[USER] {content}"
         elif isinstance(msg, ToolMessage):
             # Tool result message
-            content = msg.content if msg.content else "[No content]"
+            content = str(msg.content) if msg.content else "[No content]"
             tool_name = getattr(msg, 'name', 'unknown')
-            approx_tokens = self._count_approx_tokens_message(msg)
-            content_preview = content[:100] if len(str(content)) > 100 else content
-            return f"[TOOL RESULT: {tool_name}] ~{approx_tokens} tokens - {content_preview}..." if len(str(content)) > 100 else f"[TOOL RESULT: {tool_name}] {content}"
+            if len(content) > 100:
+                approx_tokens = self._count_approx_tokens_message(msg)
+                return f"[TOOL RESULT: {tool_name}] ~{approx_tokens} tokens - {content[:100]}..."
+            return f"[TOOL RESULT: {tool_name}] {content}"
         elif isinstance(msg, AIMessage):
-            content = msg.content if msg.content else "[No content]"
+            content = str(msg.content) if msg.content else "[No content]"
             tool_calls = ""
             if hasattr(msg, 'tool_calls') and msg.tool_calls:
                 tool_names = [self._format_tool_call(tc) for tc in msg.tool_calls]
                 tool_calls = f" [Tools: {', '.join(tool_names)}]"
-            return f"[AI] {content[:200]}{tool_calls}" if len(str(content)) > 200 else f"[AI] {content}{tool_calls}"
+            return f"[AI] {content[:200]}{tool_calls}" if len(content) > 200 else f"[AI] {content}{tool_calls}"
         elif hasattr(msg, 'type'):
             return f"[{msg.type.upper()}] {str(msg)[:200]}"
         else:
@@ -220,16 +223,18 @@ class ModelLoggingMiddleware(AgentMiddleware):
         Returns:
             Dictionary with tool result statistics
         """
-        tool_results = [msg for msg in messages if isinstance(msg, ToolMessage)]
-
-        if not tool_results:
-            return {"count": 0, "approx_tokens": 0}
-
-        # Count approximate tokens in tool results
-        total_tokens = sum(self._count_approx_tokens_message(msg) for msg in tool_results)
+        # Single pass: count and token-estimate in one traversal rather
+        # than materializing an intermediate list — this runs on every
+        # before_model over the full history.
+        count = 0
+        total_tokens = 0
+        for msg in messages:
+            if isinstance(msg, ToolMessage):
+                count += 1
+                total_tokens += self._count_approx_tokens_message(msg)
 
         return {
-            "count": len(tool_results),
+            "count": count,
             "approx_tokens": total_tokens
         }
 
@@ -245,24 +250,29 @@ class ModelLoggingMiddleware(AgentMiddleware):
         # Always log at INFO level with tool result info
         if tool_result_info["count"] > 0:
             logger.info(
-                f"[{agent_name}] Model Call #{self._model_call_count} starting "
-                f"with {tool_result_info['count']} tool result(s) "
-                f"(~{tool_result_info['approx_tokens']} tokens)"
+                "[%s] Model Call #%d starting with %d tool result(s) (~%d tokens)",
+                agent_name, self._model_call_count,
+                tool_result_info["count"], tool_result_info["approx_tokens"],
             )
         else:
-            logger.info(f"[{agent_name}] Model Call #{self._model_call_count} starting")
+            logger.info("[%s] Model Call #%d starting",
+                        agent_name, self._model_call_count)
 
         # Detailed logging only at DEBUG level
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("=" * 80)
-            logger.debug(f"[{agent_name}] Model Call #{self._model_call_count} - PROMPT ({self._count_approx_tokens_messages(messages)} approx tokens)")
+            logger.debug("[%s] Model Call #%d - PROMPT (%d approx tokens)",
+                         agent_name, self._model_call_count,
+                         self._count_approx_tokens_messages(messages))
             if tool_result_info["count"] > 0:
-                logger.debug(f"  Tool results being sent: {tool_result_info['count']} (~{tool_result_info['approx_tokens']} tokens)")
+                logger.debug("  Tool results being sent: %d (~%d tokens)",
+                             tool_result_info["count"],
+                             tool_result_info["approx_tokens"])
             logger.debug("-" * 80)
 
             # Log each message
             for i, msg in enumerate(messages):
-                logger.debug(f"  Message {i + 1}: {self._format_message(msg)}")
+                logger.debug("  Message %d: %s", i + 1, self._format_message(msg))
 
             logger.debug("-" * 80)
 
@@ -292,19 +302,20 @@ class ModelLoggingMiddleware(AgentMiddleware):
         # Always log at INFO level with tool call count
         if concurrent_calls > 0:
             logger.info(
-                f"[{agent_name}] Model Call #{self._model_call_count} completed "
-                f"with {concurrent_calls} concurrent tool call(s)"
+                "[%s] Model Call #%d completed with %d concurrent tool call(s)",
+                agent_name, self._model_call_count, concurrent_calls,
             )
         else:
-            logger.info(f"[{agent_name}] Model Call #{self._model_call_count} completed")
+            logger.info("[%s] Model Call #%d completed",
+                        agent_name, self._model_call_count)
 
         # Log statistics periodically (every 10 calls)
         if self._model_call_count % 10 == 0 and self._total_tool_calls > 0:
             logger.info(
-                f"[{agent_name}] Tool call statistics: "
-                f"Total: {self._total_tool_calls}, "
-                f"Max concurrent: {self._max_concurrent_calls}, "
-                f"Distribution: {dict(sorted(self._concurrent_calls_distribution.items()))}"
+                "[%s] Tool call statistics: Total: %d, Max concurrent: %d, "
+                "Distribution: %s",
+                agent_name, self._total_tool_calls, self._max_concurrent_calls,
+                dict(sorted(self._concurrent_calls_distribution.items())),
             )
 
         # Detailed logging only at DEBUG level
@@ -312,11 +323,12 @@ class ModelLoggingMiddleware(AgentMiddleware):
             # The last message should be the model's response
             if messages:
                 last_message = messages[-1]
-                logger.debug(f"[{agent_name}] Model Call #{self._model_call_count} - RESPONSE")
+                logger.debug("[%s] Model Call #%d - RESPONSE",
+                             agent_name, self._model_call_count)
                 logger.debug("-" * 80)
-                logger.debug(f"  {self._format_message(last_message)}")
+                logger.debug("  %s", self._format_message(last_message))
                 if concurrent_calls > 0:
-                    logger.debug(f"  Concurrent tool calls: {concurrent_calls}")
+                    logger.debug("  Concurrent tool calls: %d", concurrent_calls)
                 logger.debug("=" * 80)
                 logger.debug("")  # Empty line for readability
 
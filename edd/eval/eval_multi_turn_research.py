@@ -8,7 +8,6 @@ over 10 turns, including:
 - JSON validation under realistic load
 - Concurrent tool call handling
 """
-import os
 import sys
 import json
 import tempfile
@@ -17,9 +16,7 @@ from datetime import datetime
 from pathlib import Path
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, AIMessage
 
-from assist.thread import Thread
 from assist.thread_manager import ThreadManager
 from assist.model_manager import select_chat_model
 
@@ -14,11 +14,11 @@ from assist.model_manager import select_assistant_model
 from assist.agent import create_agent, AgentHarness
 from assist.sandbox_manager import SandboxManager
 
-from .utils import read_file, create_filesystem, AgentTestMixin, skill_was_loaded, cleanup_workspace
+from .utils import read_file, create_filesystem, AgentTestMixin, skill_was_loaded, cleanup_workspace, tracked_mkdtemp
 
 class TestAgent(AgentTestMixin, TestCase):
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
 
         return AgentHarness(create_agent(self.model,
@@ -13,7 +13,6 @@ import json
 import os
 import re
 import stat
-import tempfile
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
@@ -34,7 +33,7 @@ from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 from edd.outcome_judge import OutcomeJudge, OutcomeObservation
 
-from .utils import create_filesystem
+from .utils import create_filesystem, tracked_mkdtemp
 
 
 _TASK_DESCRIPTIONS: dict[str, str] = {}
@@ -374,7 +373,7 @@ class TestAsyncSubagentSupervisor(TestCase):
 
     def _agent(self) -> AgentHarness:
         global _TASK_ROOT
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         _TASK_ROOT = root
         create_filesystem(root, {
             "README.org": "Personal notes live here.",
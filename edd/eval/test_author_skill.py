@@ -27,7 +27,6 @@ import os
 import re
 import shutil
 import subprocess
-import tempfile
 
 from unittest import TestCase
 
@@ -37,7 +36,7 @@ import assist
 from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
-from .utils import create_filesystem, read_file, skill_was_loaded, stub_research_subagent
+from .utils import create_filesystem, read_file, skill_was_loaded, stub_research_subagent, tracked_mkdtemp
 
 # The loader's own frontmatter extraction (deepagents skills middleware): the
 # file MUST start with `---`, or it is dropped. Mirror it exactly so the test
@@ -73,7 +72,7 @@ class TestAuthorSkill(TestCase):
         )
 
     def _make_agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {
             "README.md": "Helpers for my writing workflows.",
         })
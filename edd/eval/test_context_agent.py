@@ -1,4 +1,3 @@
-import tempfile
 from textwrap import dedent
 
 from unittest import TestCase
@@ -11,7 +10,7 @@ from assist.agent import create_agent, create_context_agent, AgentHarness
 
 from assist.model_manager import select_assistant_model
 
-from .utils import create_filesystem, AgentTestMixin
+from .utils import create_filesystem, AgentTestMixin, tracked_mkdtemp
 
 
 def _stub_subagent(*args, **kwargs):
@@ -28,7 +27,7 @@ class TestContextAgent(TestCase):
     from the local filesystem."""
 
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
 
         return AgentHarness(create_context_agent(self.model,
@@ -245,7 +244,7 @@ class TestContextInvocation(AgentTestMixin, TestCase):
         self.model = select_assistant_model(0.1)
 
     def _agent(self, filesystem=None):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem if filesystem is not None else self.FS)
         # Stub the sub-agent RUNNABLES (not their descriptions): this eval asserts
         # the orchestrator's *dispatch* decision, which is driven by the prompt +
@@ -15,10 +15,10 @@ import logging
 import os
 import subprocess
 import tempfile
-import uuid
 from unittest import TestCase
 
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages import AIMessage
+
 
 from assist.model_manager import select_assistant_model
 from assist.agent import create_agent, AgentHarness
@@ -7,13 +7,12 @@ mis-selection: the model must call `directions` (+ a mode) for "how do I get the
 other. Prompts deliberately avoid the skill's example wording (probe generalization,
 not lexical proximity).
 """
-import tempfile
 from unittest import TestCase
 
 from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
-from .utils import create_filesystem, skill_was_loaded
+from .utils import create_filesystem, skill_was_loaded, tracked_mkdtemp
 
 
 class TestDirectionsAgent(TestCase):
@@ -21,7 +20,7 @@ class TestDirectionsAgent(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {"README.org": "Personal notes."})
         return AgentHarness(create_agent(self.model, root))  # travel + directions built-in
 
@@ -3,7 +3,6 @@ import tempfile
 import shutil
 
 from unittest import TestCase
-from langchain_core.messages import ToolMessage
 
 from assist.thread_manager import ThreadManager
 from assist.domain_manager import DomainManager
@@ -24,7 +24,7 @@ from assist.egress.tools import egress_tools
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import create_filesystem, final_answer, stub_research_subagent
+from .utils import create_filesystem, final_answer, stub_research_subagent, tracked_mkdtemp
 
 _DENIAL = (EGRESS_DENIED_GUIDANCE
            + "curl: (56) Received HTTP code 403 from proxy after CONNECT\n")
@@ -69,7 +69,7 @@ class TestEgressApproval(TestCase):
                                   lambda: self.tid)
         patch.start()
         self.addCleanup(patch.stop)
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, files or {})
         backend = _DenyNetBackend(root)
         tools = egress_tools(self.store, frozenset({"pypi.org"}))
@@ -33,7 +33,7 @@ from assist.geo.tools import geo_tools
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import stub_research_subagent
+from .utils import stub_research_subagent, tracked_mkdtemp
 
 
 class _FakeHead:
@@ -64,7 +64,7 @@ class TestGeoAgent(TestCase):
     def _agent(self):
         """An agent with the geo tools over fixture stores: only NorCal loaded.
         Returns (harness, proposal_store) so tests can assert what got recorded."""
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         geo_dir = tempfile.mkdtemp()
         reg = RegionRegistry(geo_dir)
         reg.put(Region(slug="norcal", display_name="Northern California",
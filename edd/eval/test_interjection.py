@@ -14,7 +14,6 @@ harness runs outside THREAD_QUEUE.acquire (production sets it per turn).
 Research is stubbed per the mocking rule. Prompts avoid the guide's own
 vocabulary ("redirect", "fold", "mid-turn") to probe steering, not echo.
 """
-import tempfile
 import uuid
 from types import SimpleNamespace
 from unittest import TestCase, mock
@@ -27,7 +26,7 @@ from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 from manage.web.threads import _INTERJECTION_FRAME, _INTERJECTION_GUIDE
 
-from .utils import create_filesystem, final_answer, stub_research_subagent
+from .utils import create_filesystem, final_answer, stub_research_subagent, tracked_mkdtemp
 
 _BIKE_ORG = """* My bike — Linus Roadster
 ** Parts I still need
@@ -74,7 +73,7 @@ class TestInterjection(TestCase):
         journal = _Journal()
         for t in interjections:
             journal.add(t)
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, files)
         with mock.patch("assist.middleware.interjection.active_handle",
                         lambda: SimpleNamespace(thread_id="eval")), \
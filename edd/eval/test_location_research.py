@@ -16,7 +16,6 @@ with/without metrics so the EFFECT is visible, not just pass/fail.
 import os
 import re
 import shutil
-import tempfile
 from unittest import TestCase
 
 from deepagents.backends import FilesystemBackend
@@ -26,7 +25,7 @@ from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import create_filesystem, stub_research_subagent
+from .utils import create_filesystem, stub_research_subagent, tracked_mkdtemp
 
 _RENDER_SKILLS_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assist", "web_skills")
@@ -60,7 +59,7 @@ class TestLocationResearch(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _run(self, question: str, with_render: bool) -> dict:
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         self.addCleanup(shutil.rmtree, root, ignore_errors=True)
         create_filesystem(root, {"README.org": "Personal assistant workspace."})
         skills = ({"/render-skill/": FilesystemBackend(root_dir=_RENDER_SKILLS_DIR,
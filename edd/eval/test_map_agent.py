@@ -14,7 +14,6 @@ Real-LLM eval (small model) — deploy venv; partial pass rates expected.
 """
 import os
 import re
-import tempfile
 from unittest import TestCase
 
 from deepagents.backends import FilesystemBackend
@@ -23,7 +22,7 @@ from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import create_filesystem, AgentTestMixin
+from .utils import create_filesystem, AgentTestMixin, tracked_mkdtemp
 
 _RENDER_SKILLS_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assist", "web_skills")
@@ -43,7 +42,7 @@ class TestMapAgent(AgentTestMixin, TestCase):
         self.model = select_assistant_model(0.1)
 
     def _agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {"README.org": "Personal assistant workspace."})
         skills = {"/render-skill/": FilesystemBackend(root_dir=_RENDER_SKILLS_DIR,
                                                       virtual_mode=True)}
@@ -1,18 +1,15 @@
 import os
-import tempfile
-import shutil
-from textwrap import dedent
 
 from unittest import TestCase
 
 from assist.model_manager import select_assistant_model
 from assist.agent import create_agent, AgentHarness
 
-from .utils import read_file, create_filesystem, AgentTestMixin
+from .utils import read_file, create_filesystem, AgentTestMixin, tracked_mkdtemp
 
 class TestMemory(AgentTestMixin, TestCase):
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
 
         return AgentHarness(create_agent(self.model,
@@ -8,7 +8,6 @@ The gate itself (an untrusted text can't cause an effect) is a deployment proper
 sandbox + HITL, not asserted here; this eval asserts the *triage behavior* generalizes
 (paraphrase, number→name, don't-over-act, don't-under-act).
 """
-import os
 import tempfile
 import shutil
 from unittest import TestCase
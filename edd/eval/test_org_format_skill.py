@@ -11,7 +11,6 @@ SkillsMiddleware + progressive disclosure) actually changes behaviour for
 the small model on a real, breakable file-edit task.
 """
 import os
-import tempfile
 from textwrap import dedent
 
 from unittest import TestCase
@@ -19,7 +18,7 @@ from unittest import TestCase
 from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
-from .utils import create_filesystem, read_file
+from .utils import create_filesystem, read_file, tracked_mkdtemp
 
 
 class TestOrgFormatSkill(TestCase):
@@ -27,7 +26,7 @@ class TestOrgFormatSkill(TestCase):
     .org files, and does not apply org conventions when editing other files."""
 
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
         return AgentHarness(create_agent(self.model, root)), root
 
@@ -48,7 +48,7 @@ from assist.agent import create_research_agent, create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
 from .utils import (files_in_directory, create_filesystem,
-                    stub_research_subagent)
+                    stub_research_subagent, tracked_mkdtemp)
 
 # So the file can run standalone (not just under conftest's .dev.env autoload).
 os.environ.setdefault("ASSIST_MODEL_URL", "http://127.0.0.1:8000/v1")
@@ -283,7 +283,7 @@ class TestSmsEventInjection(TestCase):
         )
         rendered = sub.render("+15550001111", injected)
 
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {})
         # Build the agent INSIDE the stub context — create_agent binds the research
         # subagent at construction time, so the stub must be active THEN or the turn
@@ -14,7 +14,6 @@ generalization, not lexical echo).
 """
 import json
 import os
-import re
 import shutil
 import tempfile
 from unittest import TestCase
@@ -25,7 +25,7 @@ from assist.sandbox_manager import SandboxManager
 from assist.spec import AgentSpec
 from assist.thread_manager import _web_skill_sources
 
-from .utils import agent_tool_calls, create_filesystem
+from .utils import agent_tool_calls, create_filesystem, tracked_mkdtemp
 
 # A render block: a fenced ```render whose body has type: file and the path.
 _RENDER_BLOCK = re.compile(r"```render\b(.*?)```", re.S | re.I)
@@ -69,7 +69,7 @@ class TestRenderAgent(TestCase):
         self.model = select_assistant_model(0.1)
 
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
         return AgentHarness(create_agent(self.model, root,
                                          spec=AgentSpec(
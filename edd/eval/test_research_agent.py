@@ -1,11 +1,10 @@
-import tempfile, logging, sys
-from textwrap import dedent
+import logging, sys
 from unittest import TestCase
 
 from assist.agent import create_research_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
-from .utils import read_file, create_filesystem, files_in_directory, real_search_env
+from .utils import read_file, create_filesystem, files_in_directory, real_search_env, tracked_mkdtemp
 
 # debug logging by default
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
@@ -17,7 +16,7 @@ logging.getLogger("deepagents").setLevel(logging.DEBUG)
 
 class TestResearchAgent(TestCase):
     def create_agent(self, filesystem: dict):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, filesystem)
         
         return AgentHarness(create_research_agent(self.model,
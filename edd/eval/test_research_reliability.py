@@ -18,14 +18,13 @@ the research sub-agents bind them, so the inner sub-agent's calls are captured
 """
 import logging
 import sys
-import tempfile
 from unittest import TestCase
 
 from assist.agent import create_research_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
 from .utils import (create_filesystem, files_in_directory, normalize_url,
-                    ResearchToolSpy)
+                    ResearchToolSpy, tracked_mkdtemp)
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 
@@ -85,7 +84,7 @@ class TestResearchReliability(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {"references": {}})
         # Web async delegation executes research as a first-class child run. The
         # child is deliberately a leaf so it cannot open a second blocking
@@ -15,6 +15,7 @@ from assist.spec import AgentSpec
 from assist.schedule.tools import schedule_tools
 from assist.schedule.store import ScheduleStore
 from .utils import (
+    tracked_mkdtemp,
     agent_tool_calls, create_filesystem, skill_was_loaded,
     stub_research_subagent,
 )
@@ -28,7 +29,7 @@ class TestScheduleAgent(TestCase):
         cls.model = select_assistant_model(0.1)
 
     def _agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {"README.org": "Personal workspace."})
         store = ScheduleStore(tempfile.mkdtemp())
         return AgentHarness(create_agent(self.model, root,
@@ -23,7 +23,6 @@ Each test asserts the same thing twice over:
    correctness rule covered in test_org_format_skill.py.
 """
 import os
-import tempfile
 from textwrap import dedent
 
 from unittest import TestCase
@@ -33,7 +32,7 @@ from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
 from .utils import (create_filesystem, read_file, skill_was_loaded,
-                    stub_research_subagent)
+                    stub_research_subagent, tracked_mkdtemp)
 
 
 _PROJECTS_FIXTURE = dedent("""\
@@ -58,7 +57,7 @@ class TestSkillLoading(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _make_agent(self, *, role="main"):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {
             "README.org": "My projects are tracked in projects.org",
             "projects.org": _PROJECTS_FIXTURE,
@@ -1,25 +1,29 @@
-import os
 import tempfile
 import shutil
 
 from unittest import TestCase
-from langchain_core.messages import HumanMessage, AIMessage
 
-from assist.thread import Thread
 from assist.thread_manager import ThreadManager
 
 
 class TestThreadE2E(TestCase):
     """End-to-end tests for Thread functionality (no domain management)."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root, ignore_errors=True)
+
     def setUp(self):
-        self.working_dir = tempfile.mkdtemp()
+        # Fresh working dir per test (ThreadManager state must not leak
+        # between tests), but all under one class-level root so cleanup
+        # is a single rmtree at class teardown.
+        self.working_dir = tempfile.mkdtemp(dir=self._root)
         self.thread_manager = ThreadManager(self.working_dir)
 
-    def tearDown(self):
-        if os.path.exists(self.working_dir):
-            shutil.rmtree(self.working_dir)
-
     def test_message_and_response(self):
         """Test basic message sending and receiving."""
         thread = self.thread_manager.new()
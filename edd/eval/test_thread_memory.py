@@ -9,7 +9,7 @@ from assist.agent import AgentHarness, create_agent
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import create_filesystem, read_file
+from .utils import create_filesystem, read_file, tracked_mkdtemp
 
 
 class TestThreadMemory(TestCase):
@@ -18,7 +18,7 @@ class TestThreadMemory(TestCase):
         cls.model = select_assistant_model(0.1)
 
     def test_infers_repo_and_thread_scope(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         agent_dir = tempfile.mkdtemp()
         create_filesystem(root, {"AGENTS.md": ""})
         graph = create_agent(
@@ -52,7 +52,7 @@ class TestThreadMemory(TestCase):
         the message produces a non-empty thread-memory write; it does not verify
         that the process itself was captured or gate the thread-storage feature.
         """
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         agent_dir = tempfile.mkdtemp()
         create_filesystem(root, {"AGENTS.md": ""})
         graph = create_agent(
@@ -4,7 +4,6 @@ Spawns two real Threads concurrently, each sending one short message,
 and verifies that the queue serialized them — i.e., one thread observed
 the "queued" state for nonzero duration before acquiring the lock.
 """
-import os
 import shutil
 import tempfile
 import threading
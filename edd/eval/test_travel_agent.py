@@ -5,13 +5,12 @@ Real-LLM eval (small model) — run with the deploy venv against the live MOTIS
 the travel skill and call `travel(origin, destination)` for "how long from A to B"
 / "faster to bike or drive" questions (rather than answering from memory)?
 """
-import tempfile
 from unittest import TestCase
 
 from assist.agent import create_agent, AgentHarness
 from assist.model_manager import select_assistant_model
 
-from .utils import create_filesystem, skill_was_loaded
+from .utils import create_filesystem, skill_was_loaded, tracked_mkdtemp
 
 
 class TestTravelAgent(TestCase):
@@ -19,7 +18,7 @@ class TestTravelAgent(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _agent(self):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {"README.org": "Personal notes."})
         return AgentHarness(create_agent(self.model, root))  # travel is built-in
 
@@ -17,7 +17,6 @@ once, never crawl assets); it fails on the pre-fix agent (curl-only, no
 skill) and passes once the agent has `read_url` + the explore-website skill.
 """
 import re
-import tempfile
 from unittest import TestCase, mock
 
 from deepagents.backends.filesystem import FilesystemBackend
@@ -28,7 +27,7 @@ from assist.checkpoint_rollback import invoke_with_rollback
 from assist.model_manager import select_assistant_model
 from assist.spec import AgentSpec
 
-from .utils import create_filesystem, skill_was_loaded, stub_research_subagent
+from .utils import create_filesystem, skill_was_loaded, stub_research_subagent, tracked_mkdtemp
 
 # --- the fictional site (clearly not real; .example is reserved) --------------
 _BASE = "https://www.fathomcoffee.example"
@@ -132,7 +131,7 @@ class TestWebsiteDownload(TestCase):
         self.model = select_assistant_model(0.1)
 
     def _run(self, prompt):
-        root = tempfile.mkdtemp()
+        root = tracked_mkdtemp(self)
         create_filesystem(root, {})
         backend = _MockSiteBackend(root)
         with mock.patch("assist.tools.requests.get", _mock_requests_get), \
@@ -3,9 +3,9 @@ import functools
 import os
 import shutil
 import subprocess
+import tempfile
 from contextlib import contextmanager
 from unittest.mock import patch
-from unittest import TestCase
 from langchain_core.messages import ToolMessage, AIMessage
 from langchain_core.runnables import RunnableLambda
 # One source of truth for "the same URL" — the prod guard defines it, the eval
@@ -300,6 +300,19 @@ def cleanup_workspace(path: str) -> None:
     shutil.rmtree(path, ignore_errors=True)
 
 
+def tracked_mkdtemp(case) -> str:
+    """``tempfile.mkdtemp`` that ``case`` (a TestCase) removes at test end.
+
+    The eval ``create_agent`` helpers used to leak one directory tree per
+    test; registering the rmtree via ``addCleanup`` keeps long eval runs
+    from piling up inodes under /tmp.  ``ignore_errors`` because a
+    sandbox-backed workspace can contain root-owned files a plain rmtree
+    can't delete (those go through ``cleanup_workspace`` instead)."""
+    root = tempfile.mkdtemp()
+    case.addCleanup(shutil.rmtree, root, ignore_errors=True)
+    return root
+
+
 def create_filesystem(root_dir: str,
                       structure: dict):
     """Creates a directory structure and files according to `structure`. For example:
@@ -312,17 +325,17 @@ def create_filesystem(root_dir: str,
     a gtd directory
     a gtd/inbox.org file with content "This is the inbox file"
     ..."""
-    for name, content in structure.items():
-        path = os.path.join(root_dir, name)
-
-        if isinstance(content, str):
-            # Create a file with the given content
-            with open(path, 'w') as f:
-                f.write(content)
-        elif isinstance(content, dict):
-            # Create a directory and recursively process its contents
-            os.makedirs(path, exist_ok=True)
-            create_filesystem(path, content)
+    pending = [(root_dir, structure)]
+    while pending:
+        base, tree = pending.pop()
+        for name, content in tree.items():
+            path = os.path.join(base, name)
+            if isinstance(content, str):
+                with open(path, 'w') as f:
+                    f.write(content)
+            elif isinstance(content, dict):
+                os.makedirs(path, exist_ok=True)
+                pending.append((path, content))
 
 
 # -------------------- research URL-provenance spy --------------------
@@ -8,11 +8,15 @@ requests to vLLM, including:
 """
 import json
 import pytest
-from unittest.mock import Mock
+from types import SimpleNamespace
 from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
 
 from assist.middleware.json_validation_middleware import JsonValidationMiddleware
 
+# The middleware never touches the runtime; one inert stub shared across
+# tests is cheaper than a fresh Mock per test.
+_RUNTIME = SimpleNamespace()
+
 
 def _payload(result):
     """Concrete messages from a before_model return, minus the reset marker.
@@ -89,7 +93,7 @@ And escaped quote: \"quoted\""""
         # Create a message with problematic content
         problematic_msg = HumanMessage(content="Content with trailing backslash: \\")
         state = {"messages": [problematic_msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.before_model(state, runtime)
 
@@ -120,7 +124,7 @@ And escaped quote: \"quoted\""""
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.before_model(state, runtime)
 
@@ -197,7 +201,7 @@ This report provides a comprehensive comparison of technologies A and B.
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         # Run before_model hook
         result = middleware.before_model(state, runtime)
@@ -237,7 +241,7 @@ This report provides a comprehensive comparison of technologies A and B.
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.after_model(state, runtime)
 
@@ -262,7 +266,7 @@ This report provides a comprehensive comparison of technologies A and B.
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.after_model(state, runtime)
 
@@ -290,7 +294,7 @@ This report provides a comprehensive comparison of technologies A and B.
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         # Should raise ValueError in strict mode
         with pytest.raises(ValueError, match="Invalid JSON in tool call"):
@@ -301,7 +305,7 @@ This report provides a comprehensive comparison of technologies A and B.
         middleware = JsonValidationMiddleware(strict=False)
 
         state = {"messages": []}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         # Should not crash
         result_before = middleware.before_model(state, runtime)
@@ -325,7 +329,7 @@ This report provides a comprehensive comparison of technologies A and B.
         }]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         # Process multiple times
         for _ in range(5):
@@ -393,7 +397,7 @@ class TestInvalidEscapeInToolCallArguments:
         )
 
         state = {"messages": [HumanMessage(content="hello"), msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.before_model(state, runtime)
 
@@ -435,7 +439,7 @@ class TestInvalidEscapeInToolCallArguments:
         )
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         result = middleware.before_model(state, runtime)
 
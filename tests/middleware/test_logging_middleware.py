@@ -1,10 +1,14 @@
 """Tests for ModelLoggingMiddleware."""
 import pytest
-from unittest.mock import Mock
+from types import SimpleNamespace
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
 from assist.middleware.model_logging_middleware import ModelLoggingMiddleware
 
+# An attribute-less runtime resolves _get_agent_name to "default-agent";
+# one inert stub shared across tests is cheaper than a fresh Mock per test.
+_RUNTIME = SimpleNamespace()
+
 
 class TestModelLoggingMiddleware:
     """Test suite for model logging middleware."""
@@ -78,7 +82,7 @@ class TestModelLoggingMiddleware:
             ToolMessage(content="More results", tool_call_id="call_2")
         ]
         state = {"messages": messages}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         # Should not raise and should log appropriately
         result = middleware.before_model(state, runtime)
@@ -100,7 +104,7 @@ class TestModelLoggingMiddleware:
         ]
 
         state = {"messages": [msg]}
-        runtime = Mock()
+        runtime = _RUNTIME
 
         middleware._model_call_count = 1  # Simulate before_model was called
         result = middleware.after_model(state, runtime)
@@ -131,7 +135,7 @@ class TestModelLoggingMiddleware:
             ]
 
             state = {"messages": [msg]}
-            runtime = Mock()
+            runtime = _RUNTIME
 
             middleware._model_call_count = i + 1
             middleware.after_model(state, runtime)
@@ -13,7 +13,6 @@ import openai
 
 from assist import model_manager
 from assist.model_manager import (
-    OpenAIConfig,
     _ModelNotFoundCacheBuster,
     _resolve_api_key,
     invalidate_config_cache,
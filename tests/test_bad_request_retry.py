@@ -4,7 +4,8 @@ Deterministic unit tests using mocked model calls — no running LLM required.
 """
 import httpx
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock
+
 from openai import BadRequestError
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
@@ -2,7 +2,6 @@
 Unit tests for the edd.capture module.
 """
 import os
-import json
 import tempfile
 import shutil
 from unittest import TestCase
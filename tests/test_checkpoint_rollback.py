@@ -5,30 +5,45 @@ require a running LLM or vLLM server.
 """
 import httpx
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock
+
 from openai import BadRequestError
 
 from assist.checkpoint_rollback import invoke_with_rollback, RollbackRunnable
 
 
+# One Request exemplar shared by every fabricated error — httpx parses
+# the URL and builds header dicts per construction, and nothing under
+# test ever looks at the request side of the error.
+_REQ = httpx.Request("POST", "http://localhost/v1/chat/completions")
+
+
 def _make_bad_request_error(msg="Expecting ':' delimiter"):
     """Create a realistic BadRequestError like vLLM returns."""
-    req = httpx.Request("POST", "http://localhost/v1/chat/completions")
-    resp = httpx.Response(400, json={"error": {"message": msg}}, request=req)
+    resp = httpx.Response(400, json={"error": {"message": msg}}, request=_REQ)
     return BadRequestError(msg, response=resp, body={"error": {"message": msg}})
 
 
+class _Snap:
+    """Minimal StateSnapshot stand-in — rollback reads only these two."""
+    __slots__ = ("config", "metadata")
+
+    def __init__(self, config, metadata):
+        self.config = config
+        self.metadata = metadata
+
+
 def _make_checkpoint(checkpoint_id, step=0):
-    """Create a mock StateSnapshot with a given checkpoint_id."""
-    snapshot = Mock()
-    snapshot.config = {
-        "configurable": {
-            "thread_id": "test-thread",
-            "checkpoint_id": checkpoint_id,
-        }
-    }
-    snapshot.metadata = {"step": step}
-    return snapshot
+    """Create a StateSnapshot stand-in with a given checkpoint_id."""
+    return _Snap(
+        config={
+            "configurable": {
+                "thread_id": "test-thread",
+                "checkpoint_id": checkpoint_id,
+            }
+        },
+        metadata={"step": step},
+    )
 
 
 class TestInvokeWithRollback:
@@ -158,13 +173,25 @@ class TestInvokeWithRollback:
         fourth_config = agent.invoke.call_args_list[3][0][1]
         assert fourth_config["configurable"]["checkpoint_id"] == "cp-0"
 
-    def test_raises_when_all_rollbacks_exhausted(self):
-        """All checkpoints × retries exhausted — raises the original error."""
+    @pytest.mark.parametrize("history,kwargs,expected_calls", [
+        pytest.param(
+            ["cp-bad", "cp-0"],
+            {"max_retries_per_step": 1, "max_rollback_depth": 1},
+            2,
+            id="all-rollbacks-exhausted",
+        ),
+        pytest.param([], {}, 1, id="no-history"),
+        pytest.param(["cp-bad"], {}, 1, id="only-bad-checkpoint"),
+    ])
+    def test_raises_original_error(self, history, kwargs, expected_calls):
+        """The original error is raised when rollback can't help:
+        checkpoints × retries exhausted, no history at all, or only the
+        bad checkpoint itself (no earlier state to resume from)."""
         agent = Mock()
         agent.invoke.side_effect = _make_bad_request_error()
         agent.get_state_history.return_value = [
-            _make_checkpoint("cp-bad", step=1),
-            _make_checkpoint("cp-0", step=0),
+            _make_checkpoint(cp_id, step=len(history) - 1 - i)
+            for i, cp_id in enumerate(history)
         ]
 
         with pytest.raises(BadRequestError):
@@ -172,10 +199,11 @@ class TestInvokeWithRollback:
                 agent,
                 {"messages": [{"role": "user", "content": "hi"}]},
                 {"configurable": {"thread_id": "t1"}},
-                max_retries_per_step=1,
-                max_rollback_depth=1,
+                **kwargs,
             )
 
+        assert agent.invoke.call_count == expected_calls
+
     def test_non_matching_errors_propagate_immediately(self):
         """Errors not in rollback_on should propagate without any rollback."""
         agent = Mock()
@@ -230,38 +258,6 @@ class TestInvokeWithRollback:
         assert result == {"messages": ["ok"]}
         assert agent.invoke.call_count == 2
 
-    def test_raises_immediately_when_no_history(self):
-        """If there are no checkpoints at all, raise without retrying."""
-        agent = Mock()
-        agent.invoke.side_effect = _make_bad_request_error()
-        agent.get_state_history.return_value = []
-
-        with pytest.raises(BadRequestError):
-            invoke_with_rollback(
-                agent,
-                {"messages": [{"role": "user", "content": "hi"}]},
-                {"configurable": {"thread_id": "t1"}},
-            )
-
-        assert agent.invoke.call_count == 1
-
-    def test_raises_when_only_bad_checkpoint_exists(self):
-        """If only the bad checkpoint exists (no earlier state), raise."""
-        agent = Mock()
-        agent.invoke.side_effect = _make_bad_request_error()
-        agent.get_state_history.return_value = [
-            _make_checkpoint("cp-bad", step=0),
-        ]
-
-        with pytest.raises(BadRequestError):
-            invoke_with_rollback(
-                agent,
-                {"messages": [{"role": "user", "content": "hi"}]},
-                {"configurable": {"thread_id": "t1"}},
-            )
-
-        assert agent.invoke.call_count == 1
-
     def test_max_rollback_depth_limits_how_far_back(self):
         """Should not go deeper than max_rollback_depth even if more
         checkpoints are available."""
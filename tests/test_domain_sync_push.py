@@ -108,7 +108,6 @@ def test_sync_aborts_agent_left_inprogress_rebase(tmp_path):
 def test_sync_reattaches_plain_detached_head(tmp_path):
     # Agent detached HEAD WITHOUT a rebase (e.g. git checkout <sha>); sync() must
     # re-branch at the current commit and commit on a branch — not orphan (Copilot rd2).
-    import os
     origin = _origin_with_main(tmp_path)
     clone = str(tmp_path / "clone")
     dm = DomainManager(repo_path=clone, repo=origin, branch_suffix="ij90")
@@ -9,7 +9,8 @@ risk).  Small quanta so the tick fires in test time.
 import threading
 import time
 
-from assist.thread_queue import ThreadAffinityQueue, active_handle
+from assist.thread_queue import ThreadAffinityQueue
+
 
 
 def _spin(pred, timeout=2.0, step=0.005):
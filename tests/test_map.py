@@ -4,13 +4,11 @@ The map data is agent-authored (untrusted small-model output), so alongside the
 happy path these pin the containment contract: a null-origin sandboxed iframe, a
 CSP, non-executable escaped data, text-node labels, and count/size caps.
 """
-import json
-import re
 from unittest import TestCase
 
 from manage.web.threads import (
     _parse_render_block, _render_map_block, _render_assistant_content,
-    _MAP_MAX_PINS, _MAP_MAX_PATHS,
+    _MAP_MAX_PINS,
 )
 
 
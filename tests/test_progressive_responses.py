@@ -1,6 +1,5 @@
 """Progressive-response migration, rendering, and failure surfacing."""
 import contextlib
-import json
 from types import SimpleNamespace
 
 import pytest
@@ -128,7 +127,6 @@ def test_peek_is_side_effect_free_on_corruption(tmp_path):
     """The loop-side read (render) must never mutate: a corrupt journal returns
     [] from peek() with the file left untouched — the move-aside belongs to the
     LOCKED read path only (Copilot #198 rd1)."""
-    import os
     from assist.backlog import MessageBacklog
     store = MessageBacklog(str(tmp_path))
     (tmp_path / "t1").mkdir()
@@ -11,11 +11,8 @@ mid-run and reopened in a fresh "process" — the crash shape, not the cooperati
 pause shape.
 """
 import contextlib
-import json
-import os
 import sqlite3
 from types import SimpleNamespace
-from unittest.mock import patch
 
 import pytest
 
@@ -6,9 +6,6 @@ Layer 0 of the threads.db growth plan
 from __future__ import annotations
 
 import os
-import shutil
-import subprocess
-import sys
 import sqlite3
 import tempfile
 from unittest import TestCase
@@ -6,7 +6,8 @@ import os
 import tempfile
 import shutil
 from unittest import TestCase, skipIf
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import patch, MagicMock
+
 
 from assist.sandbox import (
     DockerSandboxBackend,
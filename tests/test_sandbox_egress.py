@@ -5,7 +5,6 @@ right kwargs to ``containers.run`` and that ``_ensure_egress_proxy_running``
 is idempotent.  The actual policy enforcement is exercised in the
 build-time smoke (``dockerfiles/test-sandbox-egress.sh``).
 """
-import hashlib
 import os
 import shutil
 import tempfile
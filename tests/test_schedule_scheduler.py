@@ -3,7 +3,6 @@ import os
 import threading
 from datetime import datetime, timezone
 
-import pytest
 
 from assist.schedule.model import Cadence, Schedule
 from assist.schedule.scheduler import Scheduler
@@ -13,7 +13,8 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from langchain.agents.middleware import ModelRetryMiddleware
-from openai import APIConnectionError, APITimeoutError
+from openai import APITimeoutError
+
 
 from assist.middleware.bad_request_retry import BadRequestRetryMiddleware
 from assist.middleware.empty_response_recovery import (
@@ -10,7 +10,6 @@ upstream-schema mismatch; a real DB catches that.
 from __future__ import annotations
 
 import os
-import sqlite3
 import tempfile
 from unittest import TestCase
 from unittest.mock import patch
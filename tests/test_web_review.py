@@ -13,8 +13,6 @@ them without breaking the contract:
 from __future__ import annotations
 
 import json
-import os
-from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient